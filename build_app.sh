@@ -84,6 +84,11 @@ if [ -f "icon.png" ]; then
     echo "  Bundling icon.png for window title bar icon"
 fi
 
+if [ -f "checkmark.png" ]; then
+    CHECK_DATA_FLAG="--add-data=checkmark.png:."
+    echo "  Bundling checkmark.png for checkbox indicators"
+fi
+
 # Build with PyInstaller
 echo ""
 echo "Step 4: Building .app bundle..."
@@ -95,6 +100,7 @@ $PYTHON -m PyInstaller \
     --osx-bundle-identifier "${BUNDLE_ID}" \
     $ICON_FLAG \
     $ADD_DATA_FLAG \
+    $CHECK_DATA_FLAG \
     --hidden-import=pyzotero \
     --hidden-import=lxml \
     --hidden-import=lxml.etree \
@@ -19,20 +19,25 @@ Or build as .app:
     bash build_app.sh
 """
 
-import atexit
 import base64
 import binascii
+import copy
+import gzip
 import json
 import os
 import platform
+import posixpath
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import traceback
-import uuid
 import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
 
 # ──────────────────────────────────────────────
 # GUI imports (PyQt6 - no Tcl/Tk dependency)
@@ -40,12 +45,12 @@ import zipfile
 try:
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-        QLabel, QLineEdit, QPushButton, QTextEdit, QFileDialog,
+        QLabel, QLineEdit, QPushButton, QPlainTextEdit, QFileDialog,
         QMessageBox, QProgressBar, QCheckBox, QComboBox, QGroupBox,
         QFrame, QListWidget, QListWidgetItem,
         QAbstractItemView, QTabWidget, QScrollArea
     )
-    from PyQt6.QtCore import Qt, QThread, pyqtSignal
+    from PyQt6.QtCore import Qt, QSettings, QThread, QTimer, pyqtSignal
     from PyQt6.QtGui import QFont, QIcon
 except ImportError:
     sys.exit(
@@ -71,6 +76,27 @@ except ImportError:
 
 DEFAULT_STYLE_URI = "http://www.zotero.org/styles/harvard-cite-them-right"
 
+# The .docx parts that can hold citations
+CITATION_PARTS = ("word/document.xml", "word/footnotes.xml", "word/endnotes.xml")
+
+# Citation styles offered in the GUI, display name -> Zotero style URI
+_CITATION_STYLES = MappingProxyType({
+    "Harvard - Cite Them Right": DEFAULT_STYLE_URI,
+    "APA 7th Edition": "http://www.zotero.org/styles/apa",
+    "APA 6th Edition": "http://www.zotero.org/styles/apa-6th-edition",
+    "Chicago (Author-Date)": "http://www.zotero.org/styles/chicago-author-date",
+    "Chicago (Note)": "http://www.zotero.org/styles/chicago-note-bibliography",
+    "Vancouver": "http://www.zotero.org/styles/vancouver",
+    "IEEE": "http://www.zotero.org/styles/ieee",
+    "Nature": "http://www.zotero.org/styles/nature",
+    "BMJ": "http://www.zotero.org/styles/bmj",
+    "AMA 11th Edition": "http://www.zotero.org/styles/american-medical-association",
+    "MLA 9th Edition": "http://www.zotero.org/styles/modern-language-association",
+    "Springer - Basic (Author-Date)": "http://www.zotero.org/styles/springer-basic-author-date",
+    "Elsevier - Harvard": "http://www.zotero.org/styles/elsevier-harvard",
+    "DIN 1505-2": "http://www.zotero.org/styles/din-1505-2",
+})
+
 NAMESPACES = {
     "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
     "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
@@ -80,53 +106,133 @@ NAMESPACES = {
 for _prefix, _uri in NAMESPACES.items():
     etree.register_namespace(_prefix, _uri)
 
+# Clark-notation tag names, built once instead of per call
+_W = f"{{{NAMESPACES['w']}}}"
+W_SDTPR = _W + "sdtPr"
+W_TAG = _W + "tag"
+W_VAL = _W + "val"
+W_SDTCONTENT = _W + "sdtContent"
+W_INSTRTEXT = _W + "instrText"
+W_FLDCHAR = _W + "fldChar"
+W_FLDCHARTYPE = _W + "fldCharType"
+W_T = _W + "t"
+W_R = _W + "r"
+W_P = _W + "p"
+W_SDT = _W + "sdt"
+W_BODY = _W + "body"
+W_SECTPR = _W + "sectPr"
+W_RPR = _W + "rPr"
+W_NOPROOF = _W + "noProof"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Shared by the tree parser and the streaming counter in verify_conversion
+_PARSER_OPTIONS = dict(remove_blank_text=False, resolve_entities=False,
+                       load_dtd=False, no_network=True,
+                       collect_ids=False, huge_tree=True)
+
+_parser_local = threading.local()
+
+
+def _parser():
+    """XML parser for OOXML parts, one per thread (lxml parsers are not thread-safe).
+
+    Entities and DTDs are never loaded and nothing is fetched over the
+    network, the xml:id hash table (unused in OOXML) is skipped and
+    libxml2's size limits are lifted for very large documents."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(**_PARSER_OPTIONS)
+        _parser_local.parser = parser
+    return parser
+
+
+# Compiled XPath queries (evaluated entirely inside libxml2)
+_CITAVI_SDT_PREDICATE = "w:sdtPr/w:tag[starts-with(@w:val, 'CitaviPlaceholder#')]"
+_XP_CITAVI_SDT = etree.XPath(f"//w:sdt[{_CITAVI_SDT_PREDICATE}]", namespaces=NAMESPACES)
+# The same test for a single sdt element, e.g. while streaming with iterparse
+_XP_IS_CITAVI_SDT = etree.XPath(f"boolean({_CITAVI_SDT_PREDICATE})", namespaces=NAMESPACES)
+_XP_HAS_ZOTERO_BIBL = etree.XPath(
+    "boolean(//w:instrText[contains(., 'ZOTERO_BIBL')])", namespaces=NAMESPACES
+)
+_XP_CITAVI_BIB = etree.XPath(
+    "//w:sdt[w:sdtPr/w:tag[contains(@w:val, 'CitaviBibliography') or "
+    "contains(@w:val, 'CitaviFilteredBibliography')]]",
+    namespaces=NAMESPACES,
+)
+_XP_FLDCHAR_AND_T = etree.XPath(".//w:fldChar | .//w:t", namespaces=NAMESPACES)
+
+# Regular expressions used while parsing and matching, compiled once
+_RE_YEAR = re.compile(r'\b(1[0-9]{3}|2[0-9]{3})\b')
+_RE_YEAR4 = re.compile(r'(\d{4})')
+_RE_ISBN_STRIP = re.compile(r'[\s-]')
+_RE_ETAL = re.compile(r'\s*et\s+al\.?\s*$', re.IGNORECASE)
+# Common citation prefixes in multiple languages:
+# German: "vgl." (vergleiche), "s." (siehe), "s.a." (siehe auch)
+# English: "cf.", "see", "see also"
+# French: "cf.", "voir", "voir aussi"
+# Spanish: "véase", "cf."
+# Italian: "cfr.", "vedi"
+# Portuguese: "cf.", "ver", "veja"
+# Dutch: "vgl.", "zie"
+_RE_PREFIX = re.compile(
+    r'^(?:vgl\.|cf\.|cfr\.|see(?:\s+also)?|voir(?:\s+aussi)?|'
+    r's\.(?:a\.)?|véase|vedi|ver\b|veja|zie)\s*',
+    re.IGNORECASE
+)
+_RE_PRIMARY_SPLIT = re.compile(r'\s*&\s*|\s+and\s+|\s*,\s*', re.IGNORECASE)
+# German "und", French "et", Spanish "y", Italian "e", Dutch "en"
+_RE_CONNECTORS = [
+    re.compile(c, re.IGNORECASE)
+    for c in (r'\s+und\s+', r'\s+et\s+', r'\s+y\s+', r'\s+e\s+', r'\s+en\s+')
+]
+_RE_TRAIL_INITIAL = re.compile(r'\s+[A-Z]\.?\s*$')
+# Characters not allowed in the library ID part of a cache file name
+_RE_UNSAFE_ID = re.compile(r'[^A-Za-z0-9_-]')
+
 
 # ── Citavi Parsing ────────────────────────────
 
 def find_citavi_sdts(tree):
-    sdts = []
-    for sdt in tree.iter(f"{{{NAMESPACES['w']}}}sdt"):
-        sdt_pr = sdt.find(f"{{{NAMESPACES['w']}}}sdtPr")
-        if sdt_pr is None:
-            continue
-        tag_elem = sdt_pr.find(f"{{{NAMESPACES['w']}}}tag")
-        if tag_elem is None:
-            continue
-        tag_val = tag_elem.get(f"{{{NAMESPACES['w']}}}val", "")
-        if tag_val.startswith("CitaviPlaceholder#"):
-            sdts.append((sdt, tag_val))
-    return sdts
+    return [(sdt, sdt.find(W_SDTPR).find(W_TAG).get(W_VAL)) for sdt in _XP_CITAVI_SDT(tree)]
 
 
-def decode_citavi_payload(sdt):
-    sdt_content = sdt.find(f"{{{NAMESPACES['w']}}}sdtContent")
-    if sdt_content is None:
+def _decode_base64_json(candidate):
+    try:
+        decoded = base64.b64decode(candidate).decode("utf-8", errors="replace")
+        return json.loads(decoded)
+    except (json.JSONDecodeError, ValueError, UnicodeDecodeError, binascii.Error):
         return None
 
-    instr_parts = []
-    for instr in sdt_content.iter(f"{{{NAMESPACES['w']}}}instrText"):
-        if instr.text:
-            instr_parts.append(instr.text.strip())
 
-    if not instr_parts:
+def decode_citavi_payload(sdt):
+    sdt_content = sdt.find(W_SDTCONTENT)
+    if sdt_content is None:
         return None
 
-    raw = "".join(instr_parts)
-
-    for candidate in [raw, raw.split(None, 1)[-1] if " " in raw else raw]:
-        candidate = candidate.strip()
-        if not candidate:
-            continue
-        try:
-            decoded = base64.b64decode(candidate).decode("utf-8", errors="replace")
-            return json.loads(decoded)
-        except (json.JSONDecodeError, ValueError, UnicodeDecodeError, binascii.Error):
-            pass
+    # Join the instrText chunks as-is: stripping each one would drop
+    # whitespace that sits on a chunk boundary inside the payload.
+    raw = "".join(instr.text for instr in sdt_content.iter(W_INSTRTEXT) if instr.text).strip()
+    if not raw:
+        return None
 
-    json_match = re.search(r'\{.*\}', raw, re.DOTALL)
-    if json_match:
+    # b64decode discards whitespace itself, so one attempt covers a bare payload
+    payload = _decode_base64_json(raw)
+    if payload is not None:
+        return payload
+
+    # The payload may follow a leading keyword (e.g. "ADDIN <payload>")
+    parts = raw.split(None, 1)
+    if len(parts) == 2:
+        payload = _decode_base64_json(parts[1])
+        if payload is not None:
+            return payload
+
+    # Plain JSON: take everything from the first "{" to the last "}"
+    start = raw.find("{")
+    end = raw.rfind("}")
+    if start != -1 and end > start:
         try:
-            return json.loads(json_match.group())
+            return json.loads(raw[start:end + 1])
         except json.JSONDecodeError:
             pass
 
@@ -134,21 +240,21 @@ def decode_citavi_payload(sdt):
 
 
 def extract_citavi_display_text(sdt):
-    sdt_content = sdt.find(f"{{{NAMESPACES['w']}}}sdtContent")
+    sdt_content = sdt.find(W_SDTCONTENT)
     if sdt_content is None:
         return ""
 
     texts = []
     in_display = False
-    for elem in sdt_content.iter():
-        tag = etree.QName(elem.tag).localname if isinstance(elem.tag, str) else ""
-        if tag == "fldChar":
-            fld_type = elem.get(f"{{{NAMESPACES['w']}}}fldCharType", "")
+    # Only fldChar and t elements matter; XPath returns them in document order
+    for elem in _XP_FLDCHAR_AND_T(sdt_content):
+        if elem.tag == W_FLDCHAR:
+            fld_type = elem.get(W_FLDCHARTYPE, "")
             if fld_type == "separate":
                 in_display = True
             elif fld_type == "end":
                 in_display = False
-        if in_display and tag == "t" and elem.text:
+        elif in_display and elem.text:
             texts.append(elem.text)
 
     return "".join(texts).strip()
@@ -189,19 +295,20 @@ def extract_citation_info_from_citavi(payload):
 
         for key in ["Year", "year", "YearResolved", "Date"]:
             if key in entry and entry[key]:
-                year_match = re.search(r'\b(1[0-9]{3}|2[0-9]{3})\b', str(entry[key]))
+                year_match = _RE_YEAR.search(str(entry[key]))
                 if year_match:
                     info["year"] = year_match.group(1)
                 break
 
         for key in ["Doi", "doi", "DOI"]:
             if key in entry and entry[key]:
-                info["doi"] = str(entry[key]).strip()
+                # Normalized here once, so matching is a plain dict lookup
+                info["doi"] = str(entry[key]).strip().lower()
                 break
 
         for key in ["Isbn", "isbn", "ISBN"]:
             if key in entry and entry[key]:
-                info["isbn"] = str(entry[key]).strip()
+                info["isbn"] = _RE_ISBN_STRIP.sub('', str(entry[key]))
                 break
 
         return info if info else None
@@ -240,57 +347,254 @@ def extract_citation_info_from_citavi(payload):
 
 # ── Zotero Matching ───────────────────────────
 
+def _cache_dir():
+    """Per-user cache directory, following each platform's convention."""
+    system = platform.system()
+    if system == "Darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    elif system == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~/AppData/Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "CiteMigrate")
+
+
 class ZoteroMatcher:
+    PAGE_SIZE = 100
+    # Concurrent page requests while loading the library; kept low to stay
+    # well within Zotero's API rate limits.
+    PAGE_WORKERS = 4
+
     def __init__(self, library_id, api_key, library_type="user"):
+        self.library_id = library_id
+        self.library_type = library_type
+        self._api_key = api_key
         self.zot = zotero.Zotero(library_id, library_type, api_key)
         self._cache = {}
+        self._display_cache = {}
         self._all_items = None
+        self._items_lock = threading.Lock()
+        self._thread_local = threading.local()
+        # Owns the per-thread pyzotero instances for the matcher's lifetime:
+        # Zotero.__del__ closes its client, which they share with self.zot
+        self._thread_zots = []
+        self._backoff_lock = threading.Lock()
+        self._backoff_until = 0.0
+        safe_id = _RE_UNSAFE_ID.sub('_', str(library_id))
+        self._cache_path = os.path.join(
+            _cache_dir(), f"zot-{safe_id}-{library_type}.json.gz")
+
+    def _thread_zot(self):
+        """pyzotero clients keep per-request state, so give each thread its own.
+
+        Where pyzotero accepts an HTTP client, the per-thread instances share
+        the main instance's connection pool, so the pages reuse its open
+        keep-alive connections instead of each doing a TLS handshake. The
+        instances are kept in ``_thread_zots``, so one being collected after
+        its thread exits can never close the shared client under self.zot."""
+        zot = getattr(self._thread_local, "zot", None)
+        if zot is None:
+            client = getattr(self.zot, "client", None)
+            if client is not None:
+                try:
+                    zot = zotero.Zotero(self.library_id, self.library_type,
+                                        self._api_key, client=client)
+                except TypeError:
+                    pass  # pyzotero version without the client argument
+            if zot is None:
+                zot = zotero.Zotero(self.library_id, self.library_type, self._api_key)
+            self._thread_zots.append(zot)
+            self._thread_local.zot = zot
+        return zot
+
+    def _share_backoff(self, zot):
+        """Pool the Backoff/Retry-After deadlines of all per-thread clients.
+
+        pyzotero waits out a server backoff only on the instance that
+        received it; copying the latest deadline to every client makes the
+        other page requests wait too instead of running into 429s."""
+        if not hasattr(zot, "backoff_until"):
+            return  # pyzotero version without explicit backoff state
+        with self._backoff_lock:
+            self._backoff_until = max(self._backoff_until, zot.backoff_until)
+            zot.backoff_until = self._backoff_until
+
+    def _fetch_page(self, start):
+        # Use top() to get only top-level items (excludes attachments & notes)
+        # This avoids URL-encoding issues with itemType filter parameters
+        zot = self._thread_zot()
+        self._share_backoff(zot)
+        try:
+            return zot.top(start=start, limit=self.PAGE_SIZE)
+        finally:
+            self._share_backoff(zot)
+
+    def _total_results(self):
+        """Library size from the Total-Results header of the last response, if present."""
+        response = getattr(self.zot, "request", None)
+        try:
+            return int(response.headers["Total-Results"])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+    def _load_cached_items(self, version):
+        """Items from the on-disk cache if it was written at this library version."""
+        try:
+            with gzip.open(self._cache_path, "rt", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, EOFError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("version") != version:
+            return None
+        items = cached.get("items")
+        return items if isinstance(items, list) else None
+
+    def _store_cached_items(self, version, all_items):
+        # Write to a temp file and rename, so an interrupted run never
+        # leaves a truncated cache behind. The cache is best effort only.
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(self._cache_path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as raw, \
+                    gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                gz.write(json.dumps({"version": version, "items": all_items}).encode("utf-8"))
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
 
     def _get_all_items(self):
         if self._all_items is not None:
             return self._all_items
 
-        self._all_items = []
-        start = 0
-        limit = 100
-        while True:
-            # Use top() to get only top-level items (excludes attachments & notes)
-            # This avoids URL-encoding issues with itemType filter parameters
+        # XML parts may be matched from several threads; load only once
+        with self._items_lock:
+            if self._all_items is not None:
+                return self._all_items
+
+            # A single cheap request tells whether the library changed since the
+            # last run; if not, the cached copy replaces the full download.
+            # The version is read before paginating, so edits made meanwhile
+            # only ever make the cache look stale, never current.
+            version = self.zot.last_modified_version()
+            all_items = self._load_cached_items(version)
+            if all_items is None:
+                all_items = self._fetch_all_items()
+                self._store_cached_items(version, all_items)
+
+            # Only publish the items once they are fully fetched and indexed
+            self._build_indices(all_items)
+            self._all_items = all_items
+            return self._all_items
+
+    def _fetch_all_items(self):
+        limit = self.PAGE_SIZE
+        items = self.zot.top(start=0, limit=limit)
+        self._share_backoff(self.zot)
+        all_items = list(items)
+        start = limit
+
+        # The first page reports the library size, so the remaining pages
+        # can be requested concurrently (pyzotero honours Backoff/Retry-After).
+        total = self._total_results()
+        if len(items) == limit and total and total > limit:
+            starts = range(limit, total, limit)
+            with ThreadPoolExecutor(max_workers=min(self.PAGE_WORKERS, len(starts))) as pool:
+                pages = list(pool.map(self._fetch_page, starts))
+            for items in pages:
+                all_items.extend(items)
+            start = starts[-1] + limit
+
+        # Serial pagination: used when the total is unknown, and picks up any
+        # items added while the pages above were being fetched
+        while len(items) == limit:
+            self._share_backoff(self.zot)
             items = self.zot.top(start=start, limit=limit)
-            if not items:
-                break
-            self._all_items.extend(items)
+            all_items.extend(items)
             start += limit
-            if len(items) < limit:
-                break
 
-        return self._all_items
+        return all_items
+
+    def _build_indices(self, all_items):
+        """Index the library once so lookups don't rescan every item per citation.
+
+        Besides the lookup dicts, the fields used for fuzzy scoring are kept
+        in flat lists aligned with the item list, pre-lowercased and
+        tokenised, so scoring never touches the item dicts."""
+        self._by_doi = {}
+        self._by_isbn = {}
+        self._by_family = defaultdict(list)     # lowercased lastName -> item indices
+        self._by_title_word = defaultdict(list)  # lowercased title word -> item indices
+        self._org_names = []                     # (lowercased name, item index) for substring matches
+
+        self._dates = []               # str(date) per item
+        self._title_wordset_lens = []  # number of distinct lowercased title words per item
+
+        for idx, item in enumerate(all_items):
+            data = item["data"]
+
+            doi = data.get("DOI", "").lower().strip()
+            if doi:
+                self._by_doi.setdefault(doi, item)
+            isbn = _RE_ISBN_STRIP.sub('', data.get("ISBN", ""))
+            if isbn:
+                self._by_isbn.setdefault(isbn, item)
+
+            for creator in data.get("creators", []):
+                creator_last = creator.get("lastName", "").lower()
+                if creator_last:
+                    self._by_family[creator_last].append(idx)
+                # "name" is used for organization/institutional authors
+                creator_name = creator.get("name", "").lower()
+                if creator_name:
+                    self._org_names.append((creator_name, idx))
+
+            title_words = frozenset(data.get("title", "").lower().split())
+            for word in title_words:
+                self._by_title_word[word].append(idx)
+
+            self._dates.append(str(data.get("date", "")))
+            self._title_wordset_lens.append(len(title_words))
+
+    def prefetch(self):
+        """Download and index the whole library now instead of on the first lookup.
+
+        All matching is done against this local copy; no request is made
+        per citation."""
+        self._get_all_items()
 
     def get_item_count(self):
         return len(self._get_all_items())
 
     def find_match(self, citation_info):
-        cache_key = json.dumps(citation_info, sort_keys=True)
+        # Key on exactly the fields the matching below reads (only the first
+        # author takes part), so equivalent citations share one entry
+        authors = citation_info.get("authors")
+        cache_key = (
+            citation_info.get("doi"),
+            citation_info.get("isbn"),
+            citation_info.get("year"),
+            citation_info.get("title"),
+            authors[0].get("family", "") if authors else "",
+        )
         if cache_key in self._cache:
             return self._cache[cache_key]
 
         items = self._get_all_items()
 
         if "doi" in citation_info:
-            doi = citation_info["doi"].lower().strip()
-            for item in items:
-                item_doi = item["data"].get("DOI", "").lower().strip()
-                if item_doi and item_doi == doi:
-                    self._cache[cache_key] = item
-                    return item
+            item = self._by_doi.get(citation_info["doi"])
+            if item is not None:
+                self._cache[cache_key] = item
+                return item
 
         if "isbn" in citation_info:
-            isbn = re.sub(r'[\s-]', '', citation_info["isbn"])
-            for item in items:
-                item_isbn = re.sub(r'[\s-]', '', item["data"].get("ISBN", ""))
-                if item_isbn and item_isbn == isbn:
-                    self._cache[cache_key] = item
-                    return item
+            item = self._by_isbn.get(citation_info["isbn"])
+            if item is not None:
+                self._cache[cache_key] = item
+                return item
 
         best_match = None
         best_score = 0
@@ -298,46 +602,64 @@ class ZoteroMatcher:
         target_year = citation_info.get("year", "")
         target_authors = citation_info.get("authors", [])
         target_family = target_authors[0].get("family", "").lower() if target_authors else ""
-
-        for item in items:
+        target_words = set(target_title.split())
+
+        # Title overlap for every item in one pass over the inverted index:
+        # each item is listed once per distinct title word, so the count per
+        # item equals the size of the word-set intersection.
+        title_overlaps = defaultdict(int)
+        for word in target_words:
+            for idx in self._by_title_word.get(word, ()):
+                title_overlaps[idx] += 1
+
+        # Items with a creator whose lastName equals the family, or whose
+        # (organization) name contains it
+        family_hits = set()
+        if target_family:
+            family_hits.update(self._by_family.get(target_family, ()))
+            for creator_name, idx in self._org_names:
+                if target_family in creator_name:
+                    family_hits.add(idx)
+
+        # Only items sharing the author or a title word can reach the
+        # minimum score of 3 (a year match alone is worth 2).
+        candidates = family_hits.union(title_overlaps)
+
+        dates = self._dates
+        title_wordset_lens = self._title_wordset_lens
+        target_len = len(target_words)
+
+        # Preserve library order so ties resolve as before
+        best_idx = None
+        for idx in sorted(candidates):
             score = 0
-            data = item["data"]
-            item_date = data.get("date", "")
-            if target_year and target_year in str(item_date):
+            if target_year and target_year in dates[idx]:
                 score += 2
 
-            item_creators = data.get("creators", [])
-            if target_family and item_creators:
-                for creator in item_creators:
-                    creator_last = creator.get("lastName", "").lower()
-                    # Also check "name" field (used for organization/institutional authors)
-                    creator_name = creator.get("name", "").lower()
-                    if (creator_last and creator_last == target_family) or \
-                       (creator_name and (creator_name == target_family or
-                        target_family in creator_name)):
-                        score += 3
-                        break
+            if idx in family_hits:
+                score += 3
 
-            item_title = data.get("title", "").lower()
-            if target_title and item_title:
-                target_words = set(target_title.split())
-                item_words = set(item_title.split())
-                if target_words and item_words:
-                    overlap = len(target_words & item_words)
-                    ratio = overlap / max(len(target_words), len(item_words))
-                    if ratio > 0.6:
-                        score += 5 * ratio
+            overlap = title_overlaps.get(idx, 0)
+            if overlap:
+                ratio = overlap / max(target_len, title_wordset_lens[idx])
+                if ratio > 0.6:
+                    score += 5 * ratio
 
             if score > best_score and score >= 3:
                 best_score = score
-                best_match = item
+                best_idx = idx
 
+        if best_idx is not None:
+            best_match = items[best_idx]
         self._cache[cache_key] = best_match
         return best_match
 
     def find_match_by_display_text(self, display_text):
         if not display_text:
             return []
+        # Documents repeat the same "(Smith 2019)" many times; parse it once
+        if display_text in self._display_cache:
+            return self._display_cache[display_text]
 
         text = display_text.strip("()[] ")
         parts = [p.strip() for p in text.split(";")]
@@ -348,7 +670,7 @@ class ZoteroMatcher:
                 continue
 
             # Try to extract year (4-digit number) from the citation part
-            year_match = re.search(r'(\d{4})', part)
+            year_match = _RE_YEAR4.search(part)
             if not year_match:
                 continue
             year = year_match.group(1)
@@ -356,36 +678,22 @@ class ZoteroMatcher:
             # Everything before the year is the author portion
             author_portion = part[:year_match.start()].strip().rstrip(",").strip()
             # Remove "et al." / "et al" from author portion
-            author_portion = re.sub(r'\s*et\s+al\.?\s*$', '', author_portion, flags=re.IGNORECASE).strip()
+            author_portion = _RE_ETAL.sub('', author_portion).strip()
 
             if not author_portion:
                 continue
 
-            # Strip common citation prefixes in multiple languages:
-            # German: "vgl." (vergleiche), "s." (siehe), "s.a." (siehe auch)
-            # English: "cf.", "see", "see also"
-            # French: "cf.", "voir", "voir aussi"
-            # Spanish: "véase", "cf."
-            # Italian: "cfr.", "vedi"
-            # Portuguese: "cf.", "ver", "veja"
-            # Dutch: "vgl.", "zie"
-            author_portion = re.sub(
-                r'^(?:vgl\.|cf\.|cfr\.|see(?:\s+also)?|voir(?:\s+aussi)?|'
-                r's\.(?:a\.)?|véase|vedi|ver\b|veja|zie)\s*',
-                '', author_portion, flags=re.IGNORECASE
-            ).strip()
+            # Strip common citation prefixes in multiple languages ("vgl.", "cf.", ...)
+            author_portion = _RE_PREFIX.sub('', author_portion).strip()
 
             # Extract primary author by splitting on "&", " and ", ","
             # For " und " (German): only split if it separates short name-like parts
             # (to avoid breaking org names like "National Institute of Health und Medical Research")
             # Also handle French "et", Spanish "y", Italian "e", Dutch "en"
-            primary_author = re.split(
-                r'\s*&\s*|\s+and\s+|\s*,\s*',
-                author_portion, flags=re.IGNORECASE
-            )[0].strip()
+            primary_author = _RE_PRIMARY_SPLIT.split(author_portion)[0].strip()
             # Now try splitting on connectors only if both sides look like short author names
-            for connector in [r'\s+und\s+', r'\s+et\s+', r'\s+y\s+', r'\s+e\s+', r'\s+en\s+']:
-                parts = re.split(connector, primary_author, flags=re.IGNORECASE)
+            for connector in _RE_CONNECTORS:
+                parts = connector.split(primary_author)
                 if len(parts) > 1 and len(parts[0].split()) <= 2:
                     primary_author = parts[0].strip()
                     break
@@ -395,7 +703,7 @@ class ZoteroMatcher:
 
             # Handle names with trailing initials like "Miller J." or "John Smith"
             # Strip trailing single-letter initials (with or without period)
-            primary_author = re.sub(r'\s+[A-Z]\.?\s*$', '', primary_author).strip()
+            primary_author = _RE_TRAIL_INITIAL.sub('', primary_author).strip()
 
             # If primary_author has multiple words (e.g. "John Smith" or
             # "World Health Organization"), try matching with:
@@ -420,7 +728,7 @@ class ZoteroMatcher:
             # or title-based search
             if not result and len(words) > 2:
                 # Try the full original author_portion as org name (before und-splitting)
-                full_author = re.sub(r'\s+[A-Z]\.?\s*$', '', author_portion).strip()
+                full_author = _RE_TRAIL_INITIAL.sub('', author_portion).strip()
                 if full_author != primary_author:
                     citation_info = {
                         "authors": [{"family": full_author, "given": ""}],
@@ -440,6 +748,7 @@ class ZoteroMatcher:
             if result:
                 matches.append(result)
 
+        self._display_cache[display_text] = matches
         return matches
 
 
@@ -480,7 +789,7 @@ def zotero_item_to_csl_json(item):
         csl["editor"] = editors
 
     if data.get("date"):
-        year_match = re.search(r'(\d{4})', data["date"])
+        year_match = _RE_YEAR4.search(data["date"])
         if year_match:
             csl["issued"] = {"date-parts": [[year_match.group(1)]]}
 
@@ -505,16 +814,21 @@ def zotero_item_to_csl_json(item):
     return csl
 
 
+_ZOTERO_ITEM_URI = "http://zotero.org/users/{}/items/{}".format
+
+
 def build_zotero_citation_json(zotero_items, user_id):
-    citation_id = str(uuid.uuid4()).replace("-", "")[:12]
+    # 12 random hex characters, as Zotero's own citation IDs
+    citation_id = os.urandom(6).hex()
     citation_items = []
     for item in zotero_items:
         csl_data = zotero_item_to_csl_json(item)
         item_key = item.get("key", "")
+        uri = _ZOTERO_ITEM_URI(user_id, item_key)
         citation_items.append({
             "id": item_key,
-            "uris": [f"http://zotero.org/users/{user_id}/items/{item_key}"],
-            "uri": [f"http://zotero.org/users/{user_id}/items/{item_key}"],
+            "uris": [uri],
+            "uri": [uri],
             "itemData": csl_data,
         })
 
@@ -535,78 +849,72 @@ def build_zotero_citation_json(zotero_items, user_id):
 
 # ── XML Manipulation ──────────────────────────
 
-def create_zotero_field_xml(citation_json_str, display_text):
-    W = f"{{{NAMESPACES['w']}}}"
-    runs = []
+def create_zotero_field_xml(citation_json_str, display_text, *, parent=None):
+    """Build the runs of a ZOTERO_ITEM field and return them as a list.
 
-    r_begin = etree.Element(f"{W}r")
-    fc_begin = etree.SubElement(r_begin, f"{W}fldChar")
-    fc_begin.set(f"{W}fldCharType", "begin")
-    runs.append(r_begin)
+    With ``parent`` the runs are created directly inside that element,
+    saving a detach/attach per run when it is spliced into the document."""
+    container = parent if parent is not None else etree.Element(W_P)
+    start = len(container)
+
+    r_begin = etree.SubElement(container, W_R)
+    fc_begin = etree.SubElement(r_begin, W_FLDCHAR)
+    fc_begin.set(W_FLDCHARTYPE, "begin")
 
     instr_text = f" ADDIN ZOTERO_ITEM CSL_CITATION {citation_json_str} "
     chunk_size = 250
-    for chunk in [instr_text[i:i+chunk_size] for i in range(0, len(instr_text), chunk_size)]:
-        r_instr = etree.Element(f"{W}r")
-        it = etree.SubElement(r_instr, f"{W}instrText")
-        it.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-        it.text = chunk
-        runs.append(r_instr)
-
-    r_sep = etree.Element(f"{W}r")
-    fc_sep = etree.SubElement(r_sep, f"{W}fldChar")
-    fc_sep.set(f"{W}fldCharType", "separate")
-    runs.append(r_sep)
-
-    r_display = etree.Element(f"{W}r")
-    rpr = etree.SubElement(r_display, f"{W}rPr")
-    etree.SubElement(rpr, f"{W}noProof")
-    t = etree.SubElement(r_display, f"{W}t")
-    t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+    for i in range(0, len(instr_text), chunk_size):
+        r_instr = etree.SubElement(container, W_R)
+        it = etree.SubElement(r_instr, W_INSTRTEXT)
+        it.set(XML_SPACE, "preserve")
+        it.text = instr_text[i:i + chunk_size]
+
+    r_sep = etree.SubElement(container, W_R)
+    fc_sep = etree.SubElement(r_sep, W_FLDCHAR)
+    fc_sep.set(W_FLDCHARTYPE, "separate")
+
+    r_display = etree.SubElement(container, W_R)
+    rpr = etree.SubElement(r_display, W_RPR)
+    etree.SubElement(rpr, W_NOPROOF)
+    t = etree.SubElement(r_display, W_T)
+    t.set(XML_SPACE, "preserve")
     t.text = display_text
-    runs.append(r_display)
 
-    r_end = etree.Element(f"{W}r")
-    fc_end = etree.SubElement(r_end, f"{W}fldChar")
-    fc_end.set(f"{W}fldCharType", "end")
-    runs.append(r_end)
+    r_end = etree.SubElement(container, W_R)
+    fc_end = etree.SubElement(r_end, W_FLDCHAR)
+    fc_end.set(W_FLDCHARTYPE, "end")
+
+    return container[start:]
 
-    return runs
 
+def replace_sdt_with_zotero_field(sdt, field_p):
+    """Replace ``sdt`` with the field runs built inside the paragraph ``field_p``.
 
-def replace_sdt_with_zotero_field(sdt, runs):
+    Inline SDTs are replaced by the runs themselves; block-level SDTs by
+    the whole paragraph."""
     parent = sdt.getparent()
     if parent is None:
         return False
 
-    W = f"{{{NAMESPACES['w']}}}"
-    parent_tag = etree.QName(parent.tag).localname if isinstance(parent.tag, str) else ""
-
-    if parent_tag == "p":
-        idx = list(parent).index(sdt)
-        parent.remove(sdt)
-        for i, run in enumerate(runs):
-            parent.insert(idx + i, run)
+    idx = parent.index(sdt)
+    if parent.tag == W_P:
+        parent[idx:idx + 1] = list(field_p)
     else:
-        idx = list(parent).index(sdt)
-        parent.remove(sdt)
-        p = etree.Element(f"{W}p")
-        for run in runs:
-            p.append(run)
-        parent.insert(idx, p)
+        parent[idx:idx + 1] = [field_p]
 
     return True
 
 
-def create_zotero_bibl_field_xml(style_uri=DEFAULT_STYLE_URI):
-    """Create a ZOTERO_BIBL field code to be placed at the end of the document."""
-    W = f"{{{NAMESPACES['w']}}}"
-    runs = []
+def create_zotero_bibl_field_xml(style_uri=DEFAULT_STYLE_URI, *, parent=None):
+    """Create a ZOTERO_BIBL field code to be placed at the end of the document.
 
-    r_begin = etree.Element(f"{W}r")
-    fc_begin = etree.SubElement(r_begin, f"{W}fldChar")
-    fc_begin.set(f"{W}fldCharType", "begin")
-    runs.append(r_begin)
+    Like create_zotero_field_xml, builds the runs inside ``parent`` if given."""
+    container = parent if parent is not None else etree.Element(W_P)
+    start = len(container)
+
+    r_begin = etree.SubElement(container, W_R)
+    fc_begin = etree.SubElement(r_begin, W_FLDCHAR)
+    fc_begin.set(W_FLDCHARTYPE, "begin")
 
     bibl_json = json.dumps({
         "uncited": [],
@@ -615,76 +923,59 @@ def create_zotero_bibl_field_xml(style_uri=DEFAULT_STYLE_URI):
     }, ensure_ascii=False)
     instr_text = f' ADDIN ZOTERO_BIBL {bibl_json} CSL_BIBLIOGRAPHY '
 
-    r_instr = etree.Element(f"{W}r")
-    it = etree.SubElement(r_instr, f"{W}instrText")
-    it.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+    r_instr = etree.SubElement(container, W_R)
+    it = etree.SubElement(r_instr, W_INSTRTEXT)
+    it.set(XML_SPACE, "preserve")
     it.text = instr_text
-    runs.append(r_instr)
 
-    r_sep = etree.Element(f"{W}r")
-    fc_sep = etree.SubElement(r_sep, f"{W}fldChar")
-    fc_sep.set(f"{W}fldCharType", "separate")
-    runs.append(r_sep)
+    r_sep = etree.SubElement(container, W_R)
+    fc_sep = etree.SubElement(r_sep, W_FLDCHAR)
+    fc_sep.set(W_FLDCHARTYPE, "separate")
 
-    r_display = etree.Element(f"{W}r")
-    t = etree.SubElement(r_display, f"{W}t")
-    t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+    r_display = etree.SubElement(container, W_R)
+    t = etree.SubElement(r_display, W_T)
+    t.set(XML_SPACE, "preserve")
     t.text = "{Bibliography will be generated by Zotero}"
-    runs.append(r_display)
 
-    r_end = etree.Element(f"{W}r")
-    fc_end = etree.SubElement(r_end, f"{W}fldChar")
-    fc_end.set(f"{W}fldCharType", "end")
-    runs.append(r_end)
+    r_end = etree.SubElement(container, W_R)
+    fc_end = etree.SubElement(r_end, W_FLDCHAR)
+    fc_end.set(W_FLDCHARTYPE, "end")
 
-    return runs
+    return container[start:]
 
 
 def remove_citavi_bibliography(root):
     """Remove any existing Citavi-generated bibliography from the document.
     Citavi inserts bibliographies as regular paragraphs (not SDTs),
     often preceded by a heading. Returns the number of elements removed."""
-    # Look for Citavi bibliography SDTs (tag starting with "CitaviBibliography")
-    W_NS = NAMESPACES['w']
+    # Look for Citavi bibliography SDTs (tag containing "CitaviBibliography")
     removed = 0
-    for sdt in list(root.iter(f"{{{W_NS}}}sdt")):
-        sdt_pr = sdt.find(f"{{{W_NS}}}sdtPr")
-        if sdt_pr is None:
-            continue
-        tag_elem = sdt_pr.find(f"{{{W_NS}}}tag")
-        if tag_elem is None:
-            continue
-        tag_val = tag_elem.get(f"{{{W_NS}}}val", "")
-        if "CitaviBibliography" in tag_val or "CitaviFilteredBibliography" in tag_val:
-            parent = sdt.getparent()
-            if parent is not None:
-                parent.remove(sdt)
-                removed += 1
+    for sdt in _XP_CITAVI_BIB(root):
+        parent = sdt.getparent()
+        if parent is not None:
+            parent.remove(sdt)
+            removed += 1
     return removed
 
 
 def add_zotero_bibl_at_end(root, style_uri):
     """Append a ZOTERO_BIBL field code as the last paragraph in the document body."""
-    W = f"{{{NAMESPACES['w']}}}"
-    body = root.find(f"{W}body")
+    body = root.find(W_BODY)
     if body is None:
         return False
 
     # Check if a Zotero bibliography already exists
-    for instr in root.iter(f"{{{NAMESPACES['w']}}}instrText"):
-        if instr.text and "ZOTERO_BIBL" in instr.text:
-            return False  # Already exists
+    if _XP_HAS_ZOTERO_BIBL(root):
+        return False
 
     # Create a new paragraph with the ZOTERO_BIBL field
-    p = etree.Element(f"{W}p")
-    bibl_runs = create_zotero_bibl_field_xml(style_uri)
-    for run in bibl_runs:
-        p.append(run)
+    p = etree.Element(W_P)
+    create_zotero_bibl_field_xml(style_uri, parent=p)
 
     # Insert before the last sectPr if present, otherwise append to body
-    sect_pr = body.find(f"{W}sectPr")
+    sect_pr = body.find(W_SECTPR)
     if sect_pr is not None:
-        body.insert(list(body).index(sect_pr), p)
+        sect_pr.addprevious(p)
     else:
         body.append(p)
 
@@ -702,8 +993,7 @@ def verify_document_integrity(root_or_path, log_callback=None):
 
     if isinstance(root_or_path, str):
         try:
-            parser = etree.XMLParser(remove_blank_text=False, resolve_entities=False)
-            tree = etree.parse(root_or_path, parser)
+            tree = etree.parse(root_or_path, _parser())
             root = tree.getroot()
         except etree.XMLSyntaxError as e:
             issues.append(f"XML syntax error: {e}")
@@ -711,33 +1001,38 @@ def verify_document_integrity(root_or_path, log_callback=None):
     else:
         root = root_or_path
 
-    W_NS = NAMESPACES['w']
-
-    # Check 1: All fldChar elements are properly paired (begin/separate/end)
+    # Checks 1 and 3 share a single walk over the fldChar and sdt elements
     field_stack = 0
-    for elem in root.iter(f"{{{W_NS}}}fldChar"):
-        fld_type = elem.get(f"{{{W_NS}}}fldCharType", "")
+    unmatched_end = False
+    sdts_without_content = 0
+    for elem in root.iter(W_FLDCHAR, W_SDT):
+        if elem.tag == W_SDT:
+            if elem.find(W_SDTCONTENT) is None:
+                sdts_without_content += 1
+            continue
+        if unmatched_end:
+            continue
+        fld_type = elem.get(W_FLDCHARTYPE)
         if fld_type == "begin":
             field_stack += 1
         elif fld_type == "end":
             field_stack -= 1
         if field_stack < 0:
-            issues.append("Unmatched field 'end' without 'begin'")
-            break
+            unmatched_end = True
 
-    if field_stack > 0:
+    # Check 1: All fldChar elements are properly paired (begin/separate/end)
+    if unmatched_end:
+        issues.append("Unmatched field 'end' without 'begin'")
+    elif field_stack > 0:
         issues.append(f"{field_stack} unclosed field(s) detected (begin without end)")
 
     # Check 2: Every paragraph is inside the body
-    body = root.find(f"{{{W_NS}}}body")
+    body = root.find(W_BODY)
     if body is None:
         issues.append("Document body element not found")
 
     # Check 3: No orphaned SDT content
-    for sdt in root.iter(f"{{{W_NS}}}sdt"):
-        sdt_content = sdt.find(f"{{{W_NS}}}sdtContent")
-        if sdt_content is None:
-            issues.append("SDT element without sdtContent found")
+    issues.extend(["SDT element without sdtContent found"] * sdts_without_content)
 
     if not issues:
         log("  Document integrity check: PASSED")
@@ -752,19 +1047,34 @@ def verify_document_integrity(root_or_path, log_callback=None):
 
 def process_xml_file(xml_path, matcher, user_id, stats, log_callback=None,
                      style_uri=DEFAULT_STYLE_URI):
+    """Convert the Citavi citations in one XML part.
+
+    ``xml_path`` may also be a binary file object such as an archive member
+    from ZipFile.open(), so parts are parsed straight from the .docx.
+    Returns the modified tree for the caller to serialize, or None if the
+    part was left unchanged."""
+    tree = etree.parse(xml_path, _parser())
+    xml_name = posixpath.basename(getattr(xml_path, "name", xml_path).replace(os.sep, "/"))
+    if _convert_part_tree(tree, xml_name, matcher, user_id,
+                          stats, log_callback, style_uri):
+        return tree
+    return None
+
+
+def _convert_part_tree(tree, xml_name, matcher, user_id, stats, log_callback,
+                       style_uri):
+    """Replace the Citavi citations in a parsed part; returns True if modified."""
     def log(msg):
         if log_callback:
             log_callback(msg)
 
-    parser = etree.XMLParser(remove_blank_text=False, resolve_entities=False)
-    tree = etree.parse(xml_path, parser)
     root = tree.getroot()
     citavi_sdts = find_citavi_sdts(root)
 
     if not citavi_sdts:
         return False
 
-    log(f"  Found {len(citavi_sdts)} Citavi citation(s) in {os.path.basename(xml_path)}")
+    log(f"  Found {len(citavi_sdts)} Citavi citation(s) in {xml_name}")
     modified = False
 
     for sdt, tag_val in citavi_sdts:
@@ -788,7 +1098,7 @@ def process_xml_file(xml_path, matcher, user_id, stats, log_callback=None,
             else:
                 author_str = ci.get("authors", [{}])[0].get("family", "?") if ci.get("authors") else "?"
                 log(f"    No match: {author_str}, {ci.get('year', '?')}")
-                stats["unmatched"].append(f"{author_str}, {ci.get('year', '?')}")
+                stats["unmatched"].add(f"{author_str}, {ci.get('year', '?')}")
 
         if not zotero_items and display_text:
             log(f"    Trying display text fallback...")
@@ -802,21 +1112,23 @@ def process_xml_file(xml_path, matcher, user_id, stats, log_callback=None,
             continue
 
         citation_json = build_zotero_citation_json(zotero_items, user_id)
-        citation_json_str = json.dumps(citation_json, ensure_ascii=False)
+        # Compact separators: fewer instrText chunks and a smaller docx
+        citation_json_str = json.dumps(citation_json, ensure_ascii=False, separators=(",", ":"))
         # Keep the original Citavi display text as visible text in the field.
         # Since we omit formattedCitation from the JSON, Zotero will treat this
         # as a new citation and regenerate display text on first refresh
         # without the "you have modified this citation" warning.
         final_display = display_text if display_text else "(Citation)"
-        runs = create_zotero_field_xml(citation_json_str, final_display)
+        field_p = etree.Element(W_P)
+        create_zotero_field_xml(citation_json_str, final_display, parent=field_p)
 
-        if replace_sdt_with_zotero_field(sdt, runs):
+        if replace_sdt_with_zotero_field(sdt, field_p):
             stats["converted"] += 1
             modified = True
             log(f"    Replaced with Zotero field code")
 
     # Only for the main document.xml: handle bibliography
-    if os.path.basename(xml_path) == "document.xml":
+    if xml_name == "document.xml":
         # Remove any Citavi bibliography SDTs
         bib_removed = remove_citavi_bibliography(root)
         if bib_removed > 0:
@@ -832,71 +1144,178 @@ def process_xml_file(xml_path, matcher, user_id, stats, log_callback=None,
     if modified:
         # Verify document integrity before writing
         verify_document_integrity(root, log_callback)
-        tree.write(xml_path, xml_declaration=True, encoding="UTF-8", standalone=True)
 
     return modified
 
 
+# The tag value find_citavi_sdts looks for, in every encoding an XML part may use
+_CITAVI_SENTINELS = tuple(
+    "CitaviPlaceholder#".encode(encoding) for encoding in ("utf-8", "utf-16-le", "utf-16-be")
+)
+
+
+def _has_citavi_bytes(zip_path):
+    """Cheap pre-scan: could any citation part contain a Citavi placeholder?
+
+    A plain byte search over the streamed parts, orders of magnitude
+    faster than parsing them."""
+    overlap = max(len(sentinel) for sentinel in _CITAVI_SENTINELS) - 1
+    with zipfile.ZipFile(zip_path, "r") as z:
+        names = set(z.namelist())
+        for name in CITATION_PARTS:
+            if name not in names:
+                continue
+            with z.open(name) as fh:
+                tail = b""
+                while True:
+                    chunk = fh.read(1 << 20)
+                    if not chunk:
+                        break
+                    buf = tail + chunk
+                    if any(sentinel in buf for sentinel in _CITAVI_SENTINELS):
+                        return True
+                    tail = buf[-overlap:]
+    return False
+
+
+def _entry_info_for(zout, info):
+    """Copy of ``info`` to write into ``zout`` at ``zout``'s compresslevel.
+
+    ZipFile.open() only applies the archive's compresslevel to entries it
+    opens by name; a passed ZipInfo brings its own, and that only became a
+    public attribute (compress_level) in Python 3.13."""
+    out_info = copy.copy(info)
+    if hasattr(out_info, "compress_level"):
+        out_info.compress_level = zout.compresslevel
+    else:
+        out_info._compresslevel = zout.compresslevel
+    return out_info
+
+
+def _copy_zip_entry(zin, zout, info):
+    """Stream one entry from ``zin`` into ``zout`` unchanged.
+
+    Embedded media can be large, so the entry is copied in chunks rather
+    than read into memory whole. The entry keeps its compression method;
+    deflated entries are recompressed at the repack's level."""
+    with zin.open(info) as src, zout.open(_entry_info_for(zout, info), "w") as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+
+
 def run_conversion(input_path, output_path, library_id, api_key, library_type,
-                   style_uri=DEFAULT_STYLE_URI,
-                   log_callback=None):
+                   *, matcher=None, style_uri=DEFAULT_STYLE_URI,
+                   log_callback=None, stage_callback=None):
+    """Convert the Citavi citations in ``input_path`` and write ``output_path``.
+
+    Pass an already connected ``matcher`` to reuse its loaded library, e.g.
+    across the files of a batch. ``stage_callback(name, percent)`` is called
+    as the conversion moves through its coarse stages."""
     def log(msg):
         if log_callback:
             log_callback(msg)
 
-    stats = {"converted": 0, "skipped": 0, "unmatched": []}
+    def stage(name, percent):
+        if stage_callback:
+            stage_callback(name, percent)
 
-    log("Connecting to Zotero API...")
-    try:
-        matcher = ZoteroMatcher(library_id, api_key, library_type)
-        count = matcher.get_item_count()
-        log(f"Found {count} items in Zotero library.")
-    except Exception as e:
-        # Sanitize error to avoid leaking API key in logs
-        err_msg = str(e)
-        if api_key and len(api_key) > 4:
-            err_msg = err_msg.replace(api_key, api_key[:4] + "****")
-        log(f"ERROR: Could not connect to Zotero: {err_msg}")
+    stats = {"converted": 0, "skipped": 0, "unmatched": set()}
+
+    # Documents without Citavi citations need neither Zotero nor a repack
+    if not _has_citavi_bytes(input_path):
+        log("No Citavi citations detected — skipping.")
+        if os.path.abspath(input_path) != os.path.abspath(output_path):
+            shutil.copy2(input_path, output_path)
         return stats
 
+    if matcher is not None:
+        log("Reusing existing Zotero connection")
+    else:
+        log("Connecting to Zotero API...")
+        stage("Loading Zotero library", 10)
+        try:
+            matcher = ZoteroMatcher(library_id, api_key, library_type)
+            matcher.prefetch()
+            count = matcher.get_item_count()
+            log(f"Found {count} items in Zotero library.")
+        except Exception as e:
+            # Sanitize error to avoid leaking API key in logs. Raised, not
+            # just logged: no output has been written, so callers must not
+            # go on to verify or open it.
+            err_msg = str(e)
+            if api_key and len(api_key) > 4:
+                err_msg = err_msg.replace(api_key, api_key[:4] + "****")
+            raise RuntimeError(f"Could not connect to Zotero: {err_msg}") from None
+
     log(f"Citation style: {style_uri}")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        extract_dir = os.path.join(tmpdir, "docx_contents")
-
-        log("\nExtracting .docx...")
-        with zipfile.ZipFile(input_path, "r") as z:
-            # Validate all member paths to prevent zip-slip path traversal
-            for member in z.namelist():
-                member_path = os.path.realpath(os.path.join(extract_dir, member))
-                if not member_path.startswith(os.path.realpath(extract_dir)):
-                    raise ValueError(
-                        f"Unsafe path in .docx archive: {member}. "
-                        "The file may be malicious."
-                    )
-            z.extractall(extract_dir)
-
-        for xml_name in ["document.xml", "footnotes.xml", "endnotes.xml"]:
-            xml_path = os.path.join(extract_dir, "word", xml_name)
-            if os.path.exists(xml_path):
-                log(f"\nProcessing word/{xml_name}...")
-                process_xml_file(xml_path, matcher, library_id, stats,
-                                log_callback, style_uri)
+    with zipfile.ZipFile(input_path, "r") as zin:
+        log("\nReading .docx...")
+        stage("Converting citations", 50)
+        infos = zin.infolist()
+        names = {info.filename for info in infos}
+        part_names = [
+            name for name in CITATION_PARTS if name in names
+        ]
 
+        def convert_part(name):
+            # Each part gets its own stats and log buffer so the parts can
+            # be converted concurrently and reported in document order
+            part_stats = {"converted": 0, "skipped": 0, "unmatched": set()}
+            part_log = [f"\nProcessing {name}..."]
+            # Parsed straight from the archive stream, without first
+            # holding a copy of the decompressed part in memory
+            with zin.open(name) as fh:
+                tree = process_xml_file(fh, matcher, library_id, part_stats,
+                                        part_log.append, style_uri)
+            return tree, part_stats, part_log
+
+        modified_parts = {}
+        if part_names:
+            with ThreadPoolExecutor(max_workers=len(part_names)) as pool:
+                futures = [pool.submit(convert_part, name) for name in part_names]
+                for name, future in zip(part_names, futures):
+                    tree, part_stats, part_log = future.result()
+                    for msg in part_log:
+                        log(msg)
+                    stats["converted"] += part_stats["converted"]
+                    stats["skipped"] += part_stats["skipped"]
+                    stats["unmatched"].update(part_stats["unmatched"])
+                    if tree is not None:
+                        modified_parts[name] = tree
+
+        # Copy the archive entry by entry; only the converted parts change.
+        # The new archive is written next to the output and swapped in at
+        # the end, so input and output may be the same file.
         log("\nRepacking .docx...")
-        content_types_path = os.path.join(extract_dir, "[Content_Types].xml")
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zout:
-            # Write [Content_Types].xml first (OOXML spec requirement)
-            if os.path.exists(content_types_path):
-                zout.write(content_types_path, "[Content_Types].xml",
-                          compress_type=zipfile.ZIP_STORED)
-            for root_dir, dirs, files in os.walk(extract_dir):
-                for file in files:
-                    if file == "[Content_Types].xml" and root_dir == extract_dir:
-                        continue  # Already written first
-                    file_path = os.path.join(root_dir, file)
-                    arcname = os.path.relpath(file_path, extract_dir)
-                    zout.write(file_path, arcname)
+        stage("Writing document", 85)
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".docx.tmp")
+        os.close(fd)
+        try:
+            # Word reads any deflate level; level 1 is several times faster
+            # than the default 6 for a slightly larger file
+            with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED,
+                                 compresslevel=1) as zout:
+                # Write [Content_Types].xml first (OOXML spec requirement)
+                for info in sorted(infos, key=lambda i: i.filename != "[Content_Types].xml"):
+                    if info.filename == "[Content_Types].xml":
+                        zout.writestr(info, zin.read(info), compress_type=zipfile.ZIP_STORED)
+                    elif info.filename in modified_parts:
+                        # Serialized straight into the entry, and each tree
+                        # is released as soon as it has been written. The
+                        # size isn't known up front, so allow for ZIP64.
+                        tree = modified_parts.pop(info.filename)
+                        with zout.open(info.filename, "w", force_zip64=True) as fh:
+                            tree.write(fh, xml_declaration=True, encoding="UTF-8",
+                                       standalone=True)
+                        del tree
+                    else:
+                        _copy_zip_entry(zin, zout, info)
+            shutil.copymode(input_path, tmp_path)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     return stats
 
@@ -920,32 +1339,39 @@ def verify_conversion(original_path, converted_path, log_callback=None):
     }
 
     def count_fields_in_docx(docx_path, field_type):
+        # Same predicates as find_citavi_sdts and the Zotero field marker,
+        # applied per element so the parts can be streamed
+        if field_type == "citavi":
+            target = W_SDT
+            matches = _XP_IS_CITAVI_SDT
+        elif field_type == "zotero":
+            target = W_INSTRTEXT
+
+            def matches(elem):
+                return bool(elem.text) and "ZOTERO_ITEM" in elem.text
+        else:
+            return 0
+
         count = 0
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with zipfile.ZipFile(docx_path, "r") as z:
-                # Validate paths to prevent zip-slip
-                for member in z.namelist():
-                    member_path = os.path.realpath(os.path.join(tmpdir, member))
-                    if not member_path.startswith(os.path.realpath(tmpdir)):
-                        raise ValueError(f"Unsafe path in archive: {member}")
-                z.extractall(tmpdir)
-
-            for xml_name in ["document.xml", "footnotes.xml", "endnotes.xml"]:
-                xml_path = os.path.join(tmpdir, "word", xml_name)
-                if not os.path.exists(xml_path):
+        # Parts are streamed straight out of the archive; nothing is
+        # extracted to disk
+        with zipfile.ZipFile(docx_path, "r") as z:
+            names = set(z.namelist())
+            for xml_name in CITATION_PARTS:
+                if xml_name not in names:
                     continue
 
-                parser = etree.XMLParser(remove_blank_text=False, resolve_entities=False)
-                tree = etree.parse(xml_path, parser)
-
-                if field_type == "citavi":
-                    sdts = find_citavi_sdts(tree)
-                    count += len(sdts)
-                elif field_type == "zotero":
-                    root = tree.getroot()
-                    for instr in root.iter(f"{{{NAMESPACES['w']}}}instrText"):
-                        if instr.text and "ZOTERO_ITEM" in instr.text:
+                # Paragraphs are discarded once seen, so memory stays
+                # bounded by a single paragraph instead of the whole part
+                with z.open(xml_name) as fh:
+                    for _event, elem in etree.iterparse(
+                            fh, events=("end",), tag=(target, W_P),
+                            **_PARSER_OPTIONS):
+                        if elem.tag == target and matches(elem):
                             count += 1
+                        elem.clear(keep_tail=True)
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
 
         return count
 
@@ -1000,9 +1426,16 @@ def open_in_word_and_refresh(original_path, converted_path, log_callback=None):
     script = (
         'tell application "Microsoft Word"\n'
         '    activate\n'
+        '    set startCount to count of documents\n'
         f'    set origDoc to open file name POSIX file "{original_path}"\n'
         f'    set convDoc to open file name POSIX file "{converted_path}"\n'
-        '    delay 2\n'
+        # Wait until both documents are open (at most 2 s, as the old fixed delay)
+        '    repeat 20 times\n'
+        '        try\n'
+        '            if (count of documents) >= startCount + 2 then exit repeat\n'
+        '        end try\n'
+        '        delay 0.1\n'
+        '    end repeat\n'
         '    try\n'
         '        tell convDoc\n'
         '            update every field of convDoc\n'
@@ -1039,9 +1472,39 @@ def open_in_word_and_refresh(original_path, converted_path, log_callback=None):
 # WORKER THREAD (PyQt6 QThread)
 # ══════════════════════════════════════════════
 
+def _unique_output_path(input_path):
+    """Next free ``<name>_zotero[_N].docx`` path next to ``input_path``.
+
+    The directory is listed once instead of probing each candidate; names
+    are compared case-insensitively, as on the default macOS/Windows file
+    systems, so an existing file is never picked."""
+    input_dir = os.path.dirname(input_path)
+    input_name = os.path.splitext(os.path.basename(input_path))[0]
+    prefix = f"{input_name}_zotero"
+    folded_prefix = prefix.casefold()
+    with os.scandir(input_dir or os.curdir) as entries:
+        existing = {
+            entry.name.casefold() for entry in entries
+            if entry.name.casefold().startswith(folded_prefix)
+        }
+
+    candidate = f"{prefix}.docx"
+    counter = 1
+    while candidate.casefold() in existing:
+        candidate = f"{prefix}_{counter}.docx"
+        counter += 1
+        if counter > 1000:
+            raise RuntimeError(
+                f"Too many output files for {os.path.basename(input_path)} "
+                "— clean up old _zotero files."
+            )
+    return os.path.join(input_dir, candidate)
+
+
 class ConversionWorker(QThread):
     """Background thread for running the conversion."""
     log_signal = pyqtSignal(str)
+    stage_signal = pyqtSignal(str, int)  # stage, percent
     finished_signal = pyqtSignal(dict)
     error_signal = pyqtSignal(str)
 
@@ -1066,31 +1529,19 @@ class ConversionWorker(QThread):
             self._log("CITEMIGRATE — CITATION CONVERSION")
             self._log("=" * 50)
 
-            # Step 1: Create copy (use O_EXCL via fd for atomic creation)
-            input_dir = os.path.dirname(input_path)
-            input_name = os.path.splitext(os.path.basename(input_path))[0]
-            output_path = os.path.join(input_dir, f"{input_name}_zotero.docx")
-
-            counter = 1
-            while os.path.exists(output_path):
-                output_path = os.path.join(input_dir, f"{input_name}_zotero_{counter}.docx")
-                counter += 1
-                if counter > 1000:
-                    raise RuntimeError("Too many output files — clean up old _zotero files.")
+            output_path = _unique_output_path(input_path)
 
             self._log(f"\nOriginal:  {os.path.basename(input_path)}")
             self._log(f"Output:    {os.path.basename(output_path)}")
-            self._log("\nStep 1: Creating copy of original document...")
-            shutil.copy2(input_path, output_path)
-            self._log(f"  Copy created: {os.path.basename(output_path)}")
 
-            # Step 2: Convert
-            self._log("\nStep 2: Converting citations...")
+            # Step 1: Convert (the original is read, never written)
+            self._log("\nStep 1: Converting citations...")
             stats = run_conversion(
-                output_path, output_path,
+                input_path, output_path,
                 self.library_id, self.api_key, self.library_type,
                 style_uri=self.style_uri,
-                log_callback=self._log
+                log_callback=self._log,
+                stage_callback=self.stage_signal.emit
             )
 
             self._log(f"\n--- Conversion Results ---")
@@ -1100,28 +1551,39 @@ class ConversionWorker(QThread):
 
             if stats["unmatched"]:
                 self._log(f"\n  Unmatched references:")
-                for ref in stats["unmatched"]:
+                for ref in sorted(stats["unmatched"]):
                     self._log(f"    - {ref}")
 
-            # Step 3: Open in Word
-            if self.open_word:
-                self._log("\nStep 3: Opening in Word...")
-                open_in_word_and_refresh(input_path, output_path, log_callback=self._log)
-            else:
-                self._log("\nStep 3: Skipped (Word opening disabled)")
+            if self.isInterruptionRequested():
+                return
 
-            # Step 4: Verify
+            # Step 2: Verify
             verify_results = {}
             if self.verify:
-                self._log("\nStep 4: Verifying conversion...")
+                self._log("\nStep 2: Verifying conversion...")
+                self.stage_signal.emit("Verifying", 95)
                 verify_results = verify_conversion(
                     input_path, output_path, log_callback=self._log
                 )
 
+            # Step 3: Open in Word. Launched by the window once the result
+            # is in, so it overlaps with the result dialog instead of
+            # holding up verification and the dialog.
+            open_word = False
+            if self.open_word and stats["converted"] == 0:
+                self._log("\nStep 3: Skipped (no citations were converted)")
+            elif self.open_word:
+                self._log("\nStep 3: Opening in Word...")
+                open_word = True
+            else:
+                self._log("\nStep 3: Skipped (Word opening disabled)")
+
             result = {
                 "stats": stats,
                 "verify": verify_results,
+                "input_path": input_path,
                 "output_path": output_path,
+                "open_word": open_word,
             }
             self.finished_signal.emit(result)
 
@@ -1140,13 +1602,12 @@ class ConversionWorker(QThread):
 
 class BatchConversionWorker(QThread):
     """Background thread for batch-converting multiple documents."""
-    log_signal = pyqtSignal(str)
+    log_signal = pyqtSignal(list)  # lines, delivered in as few signals as possible
     finished_signal = pyqtSignal(dict)
     error_signal = pyqtSignal(str)
-    progress_signal = pyqtSignal(int, int)  # current, total
 
     def __init__(self, input_paths, library_id, api_key, library_type,
-                 verify, style_uri=DEFAULT_STYLE_URI):
+                 verify, style_uri=DEFAULT_STYLE_URI, max_workers=None):
         super().__init__()
         self.input_paths = input_paths
         self.library_id = library_id
@@ -1154,9 +1615,58 @@ class BatchConversionWorker(QThread):
         self.library_type = library_type
         self.verify = verify
         self.style_uri = style_uri
+        self.max_workers = max_workers or max(1, min(8, len(input_paths)))
+        self._log_lock = threading.Lock()
+        # Files finished so far; polled by the GUI instead of a signal per file
+        self.files_done = 0
 
     def _log(self, msg):
-        self.log_signal.emit(msg)
+        self.log_signal.emit([msg])
+
+    def _log_block(self, lines):
+        # Files are converted concurrently; each file's log crosses to the
+        # GUI thread as one signal, so files never interleave and large
+        # batches don't pay one queued event per line
+        with self._log_lock:
+            self.log_signal.emit(lines)
+
+    def _process_one(self, idx, input_path, matcher):
+        """Convert one file with the shared matcher.
+
+        Returns (stats, output_path), or (None, None) on failure."""
+        lines = [
+            f"\n{'─' * 50}",
+            f"File {idx + 1}/{len(self.input_paths)}: {os.path.basename(input_path)}",
+            f"{'─' * 50}",
+        ]
+        log = lines.append
+        try:
+            output_path = _unique_output_path(input_path)
+
+            stats = run_conversion(
+                input_path, output_path,
+                self.library_id, self.api_key, self.library_type,
+                matcher=matcher,
+                style_uri=self.style_uri,
+                log_callback=log
+            )
+
+            if self.verify:
+                verify_conversion(input_path, output_path, log_callback=log)
+
+            log(f"  Result: {stats['converted']} converted, "
+                f"{stats['skipped']} skipped")
+            return stats, output_path
+
+        except Exception as file_err:
+            err_msg = str(file_err)
+            if self.api_key and len(self.api_key) > 4:
+                err_msg = err_msg.replace(self.api_key, self.api_key[:4] + "****")
+            log(f"  ERROR: {err_msg}")
+            return None, None
+
+        finally:
+            self._log_block(lines)
 
     def run(self):
         try:
@@ -1168,6 +1678,7 @@ class BatchConversionWorker(QThread):
             # Connect to Zotero once (shared matcher for all files)
             self._log("\nConnecting to Zotero API...")
             matcher = ZoteroMatcher(self.library_id, self.api_key, self.library_type)
+            matcher.prefetch()
             count = matcher.get_item_count()
             self._log(f"Found {count} items in Zotero library.")
             self._log(f"Citation style: {self.style_uri}")
@@ -1182,55 +1693,27 @@ class BatchConversionWorker(QThread):
                 "output_paths": [],
             }
 
-            for idx, input_path in enumerate(self.input_paths):
-                self.progress_signal.emit(idx + 1, total)
-                self._log(f"\n{'─' * 50}")
-                self._log(f"File {idx + 1}/{total}: {os.path.basename(input_path)}")
-                self._log(f"{'─' * 50}")
-
-                try:
-                    input_dir = os.path.dirname(input_path)
-                    input_name = os.path.splitext(os.path.basename(input_path))[0]
-                    output_path = os.path.join(input_dir, f"{input_name}_zotero.docx")
-
-                    counter = 1
-                    while os.path.exists(output_path):
-                        output_path = os.path.join(
-                            input_dir, f"{input_name}_zotero_{counter}.docx"
-                        )
-                        counter += 1
-                        if counter > 1000:
-                            raise RuntimeError(
-                                f"Too many output files for {os.path.basename(input_path)}"
-                            )
-
-                    shutil.copy2(input_path, output_path)
-
-                    stats = run_conversion(
-                        output_path, output_path,
-                        self.library_id, self.api_key, self.library_type,
-                        style_uri=self.style_uri,
-                        log_callback=self._log
-                    )
-
+            # Files are independent and mostly wait on zip/XML I/O and the
+            # Zotero API, so they are converted concurrently
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [pool.submit(self._process_one, idx, input_path, matcher)
+                           for idx, input_path in enumerate(self.input_paths)]
+                for done, future in enumerate(as_completed(futures), 1):
+                    if self.isInterruptionRequested():
+                        # Files already converting finish; the rest never start
+                        for pending in futures:
+                            pending.cancel()
+                        return
+                    stats, output_path = future.result()
+                    self.files_done = done
+                    if stats is None:
+                        all_stats["failed"] += 1
+                        continue
                     all_stats["total_converted"] += stats["converted"]
                     all_stats["total_skipped"] += stats["skipped"]
                     all_stats["total_unmatched"] += len(stats["unmatched"])
                     all_stats["output_paths"].append(output_path)
-
-                    if self.verify:
-                        verify_conversion(input_path, output_path, log_callback=self._log)
-
                     all_stats["successful"] += 1
-                    self._log(f"  Result: {stats['converted']} converted, "
-                              f"{stats['skipped']} skipped")
-
-                except Exception as file_err:
-                    err_msg = str(file_err)
-                    if self.api_key and len(self.api_key) > 4:
-                        err_msg = err_msg.replace(self.api_key, self.api_key[:4] + "****")
-                    self._log(f"  ERROR: {err_msg}")
-                    all_stats["failed"] += 1
 
             self._log(f"\n{'=' * 50}")
             self._log(f"BATCH COMPLETE")
@@ -1381,7 +1864,7 @@ QCheckBox::indicator {
 QCheckBox::indicator:hover {
     border-color: #007aff;
 }
-QTextEdit {
+QPlainTextEdit {
     background-color: #ffffff;
     border: 1px solid #d2d2d7;
     border-radius: 8px;
@@ -1427,13 +1910,13 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
 # ══════════════════════════════════════════════
 
 class CiteMigrateApp(QMainWindow):
-    # ── Embedded checkmark image (white on transparent, 32x32 PNG) ──
-    _CHECKMARK_B64 = (
-        "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAf0lEQVR4nO2TQQ7AMAjD"
-        "wv7/Z3afWgis9BRfq81upQBCCDGMu3t0/tyQRxFjAV/pLmIkYCUzM7sSUJEfD6jKjwZ0"
-        "5FRANqMdjDwNYGa0OmflYQA7o+4LpQGrWzBRlduHAVnECTkAUB8wz9yRA+QMs5935XRA"
-        "JPkjb8FOUwghWF6WtFv8WwhlAwAAAABJRU5ErkJggg=="
-    )
+    # Log lines from the background Word automation
+    _word_log_signal = pyqtSignal(list)
+
+    # Skips per-entry icon lookups and symlink resolution, which make the
+    # pickers crawl on network mounts; the native dialog is kept
+    _FILE_DIALOG_OPTIONS = (QFileDialog.Option.DontUseCustomDirectoryIcons
+                            | QFileDialog.Option.DontResolveSymlinks)
 
     def __init__(self):
         super().__init__()
@@ -1441,23 +1924,24 @@ class CiteMigrateApp(QMainWindow):
         self.setMinimumSize(680, 700)
         self.resize(780, 940)
         self.worker = None
-        self._setup_checkmark()
+        # Workers that were let go but are still finishing (see _cleanup_worker)
+        self._retired_workers = set()
+        self._closing = False
+        # Log lines are collected here and written in one go by _flush_log
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._word_log_signal.connect(self._log_lines)
+        # Batch progress is sampled at a fixed rate, however fast files finish
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._poll_batch_progress)
+        self._settings = QSettings("CiteMigrate", "CiteMigrate")
         self._build_ui()
         self._set_app_icon()
-
-    def _setup_checkmark(self):
-        """Write checkmark PNG to a temp file for QSS to reference.
-        Registers cleanup via atexit to avoid leaving temp files behind."""
-        self._checkmark_path = os.path.join(tempfile.gettempdir(), "citemigrate_check.png")
-        try:
-            with open(self._checkmark_path, "wb") as f:
-                f.write(base64.b64decode(self._CHECKMARK_B64))
-            # Register cleanup so the temp file is removed on app exit
-            atexit.register(
-                lambda p=self._checkmark_path: os.unlink(p) if os.path.exists(p) else None
-            )
-        except Exception:
-            self._checkmark_path = ""
+        self._load_settings()
 
     def _set_app_icon(self):
         """Set app icon. Uses icon.png next to the script if available,
@@ -1658,24 +2142,7 @@ class CiteMigrateApp(QMainWindow):
 
         self.style_combo = QComboBox()
         self.style_combo.setMinimumHeight(32)
-        self._citation_styles = {
-            "Harvard - Cite Them Right": DEFAULT_STYLE_URI,
-            "APA 7th Edition": "http://www.zotero.org/styles/apa",
-            "APA 6th Edition": "http://www.zotero.org/styles/apa-6th-edition",
-            "Chicago (Author-Date)": "http://www.zotero.org/styles/chicago-author-date",
-            "Chicago (Note)": "http://www.zotero.org/styles/chicago-note-bibliography",
-            "Vancouver": "http://www.zotero.org/styles/vancouver",
-            "IEEE": "http://www.zotero.org/styles/ieee",
-            "Nature": "http://www.zotero.org/styles/nature",
-            "BMJ": "http://www.zotero.org/styles/bmj",
-            "AMA 11th Edition": "http://www.zotero.org/styles/american-medical-association",
-            "MLA 9th Edition": "http://www.zotero.org/styles/modern-language-association",
-            "Springer - Basic (Author-Date)": "http://www.zotero.org/styles/springer-basic-author-date",
-            "Elsevier - Harvard": "http://www.zotero.org/styles/elsevier-harvard",
-            "DIN 1505-2": "http://www.zotero.org/styles/din-1505-2",
-        }
-        for name in self._citation_styles:
-            self.style_combo.addItem(name)
+        self.style_combo.addItems(list(_CITATION_STYLES))
         self.style_combo.setCurrentIndex(0)
         style_layout.addWidget(self.style_combo)
 
@@ -1724,7 +2191,6 @@ class CiteMigrateApp(QMainWindow):
         # ── Progress Bar ──────────────────────
         self.progress = QProgressBar()
         self.progress.setFixedHeight(6)
-        self.progress.setRange(0, 0)  # indeterminate
         self.progress.setVisible(False)
         self.progress.setTextVisible(False)
         layout.addWidget(self.progress)
@@ -1735,8 +2201,10 @@ class CiteMigrateApp(QMainWindow):
         layout.addWidget(self.progress_label)
 
         # ── Log Area ──────────────────────────
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        # Oldest lines are dropped, so long batches don't grow the log forever
+        self.log_text.setMaximumBlockCount(2000)
         self.log_text.setMinimumHeight(160)
         layout.addWidget(self.log_text, stretch=1)
 
@@ -1777,7 +2245,8 @@ class CiteMigrateApp(QMainWindow):
     def _pick_file(self):
         filename, _ = QFileDialog.getOpenFileName(
             self, "Select Word Document", "",
-            "Word Documents (*.docx);;All Files (*)"
+            "Word Documents (*.docx);;All Files (*)",
+            options=self._FILE_DIALOG_OPTIONS
         )
         if filename:
             self.file_entry.setText(filename)
@@ -1785,51 +2254,112 @@ class CiteMigrateApp(QMainWindow):
     def _add_batch_files(self):
         files, _ = QFileDialog.getOpenFileNames(
             self, "Select Word Documents", "",
-            "Word Documents (*.docx);;All Files (*)"
+            "Word Documents (*.docx);;All Files (*)",
+            options=self._FILE_DIALOG_OPTIONS
         )
-        for f in files:
-            # Avoid duplicates
-            existing = [self.batch_list.item(i).data(Qt.ItemDataRole.UserRole)
-                        for i in range(self.batch_list.count())]
-            if f not in existing:
+        # Avoid duplicates, including within the new selection
+        existing = {self.batch_list.item(i).data(Qt.ItemDataRole.UserRole)
+                    for i in range(self.batch_list.count())}
+        # Repaint once after the whole selection instead of per item
+        self.batch_list.setUpdatesEnabled(False)
+        try:
+            for f in files:
+                if f in existing:
+                    continue
+                existing.add(f)
                 item = QListWidgetItem(os.path.basename(f))
                 item.setData(Qt.ItemDataRole.UserRole, f)
                 item.setToolTip(f)
                 self.batch_list.addItem(item)
+        finally:
+            self.batch_list.setUpdatesEnabled(True)
 
     def _remove_batch_files(self):
-        for item in self.batch_list.selectedItems():
-            self.batch_list.takeItem(self.batch_list.row(item))
+        # Bottom-up, so the remaining rows keep their indices
+        rows = sorted((self.batch_list.row(item)
+                       for item in self.batch_list.selectedItems()), reverse=True)
+        self.batch_list.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                self.batch_list.takeItem(row)
+        finally:
+            self.batch_list.setUpdatesEnabled(True)
 
     def _log(self, message):
-        self.log_text.append(message)
+        self._log_lines([message])
+
+    def _log_lines(self, lines):
+        # Coalesced: at most one document update and scroll every 50 ms,
+        # however fast the worker logs
+        self._log_buffer.extend(lines)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        self.log_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
         sb = self.log_text.verticalScrollBar()
         sb.setValue(sb.maximum())
 
+    def _clear_log(self):
+        self._log_buffer.clear()
+        self.log_text.clear()
+
     def _get_style_uri(self):
-        if self.custom_style_cb.isChecked() and self.custom_style_entry.text().strip():
-            return self.custom_style_entry.text().strip()
-        style_name = self.style_combo.currentText()
-        return self._citation_styles.get(
-            style_name, DEFAULT_STYLE_URI
-        )
+        if self.custom_style_cb.isChecked():
+            custom_uri = self.custom_style_entry.text().strip()
+            if custom_uri:
+                return custom_uri
+        return _CITATION_STYLES.get(self.style_combo.currentText(), DEFAULT_STYLE_URI)
+
+    def _load_settings(self):
+        """Restore the library and style choices of the last conversion.
+
+        The API key is deliberately never stored."""
+        settings = self._settings
+        self.library_id_entry.setText(settings.value("library_id", "", type=str))
+        for combo, key in ((self.library_type_combo, "library_type"),
+                           (self.style_combo, "style")):
+            index = combo.findText(settings.value(key, "", type=str))
+            if index >= 0:
+                combo.setCurrentIndex(index)
+        self.custom_style_entry.setText(settings.value("custom_style_uri", "", type=str))
+        self.custom_style_cb.setChecked(settings.value("use_custom_style", False, type=bool))
+
+    def _save_settings(self, library_id):
+        settings = self._settings
+        settings.setValue("library_id", library_id)
+        settings.setValue("library_type", self.library_type_combo.currentText())
+        settings.setValue("style", self.style_combo.currentText())
+        settings.setValue("custom_style_uri", self.custom_style_entry.text().strip())
+        settings.setValue("use_custom_style", self.custom_style_cb.isChecked())
 
     def _validate_api_inputs(self):
-        if not self.library_id_entry.text().strip():
+        """Return the stripped (library_id, api_key), or None after warning."""
+        library_id = self.library_id_entry.text().strip()
+        if not library_id:
             QMessageBox.warning(self, "Missing Library ID", "Please enter your Zotero Library ID.")
-            return False
-        if not self.api_key_entry.text().strip():
+            return None
+        api_key = self.api_key_entry.text().strip()
+        if not api_key:
             QMessageBox.warning(self, "Missing API Key", "Please enter your Zotero API Key.")
-            return False
-        return True
+            return None
+        return library_id, api_key
 
     # ── Conversion ────────────────────────────
 
     def _start_conversion(self):
-        if not self._validate_api_inputs():
+        credentials = self._validate_api_inputs()
+        if credentials is None:
             return
+        library_id, api_key = credentials
+        self._save_settings(library_id)
 
         is_batch = self.tabs.currentIndex() == 1
+        # Resolved once; every file of the run uses the same style
+        style_uri = self._get_style_uri()
 
         if is_batch:
             # Batch mode
@@ -1840,13 +2370,25 @@ class CiteMigrateApp(QMainWindow):
                 self.batch_list.item(i).data(Qt.ItemDataRole.UserRole)
                 for i in range(self.batch_list.count())
             ]
-            # Validate all files exist
+            # Validate all files exist, listing each directory only once
+            # (a stat per file adds up on network mounts)
+            by_dir = defaultdict(list)
             for p in input_paths:
-                if not os.path.exists(p):
-                    QMessageBox.warning(self, "File Not Found", f"File not found:\n{p}")
-                    return
+                by_dir[os.path.dirname(p)].append(p)
+            missing = []
+            for d, paths in by_dir.items():
+                try:
+                    with os.scandir(d or ".") as it:
+                        present = {entry.name for entry in it}
+                except OSError:
+                    missing.extend(paths)
+                    continue
+                missing.extend(p for p in paths if os.path.basename(p) not in present)
+            if missing:
+                QMessageBox.warning(self, "File Not Found", f"File not found:\n{missing[0]}")
+                return
 
-            self.log_text.clear()
+            self._clear_log()
             self.convert_btn.setEnabled(False)
             self.convert_btn.setText(f"Converting {len(input_paths)} files...")
             self.progress.setVisible(True)
@@ -1857,17 +2399,17 @@ class CiteMigrateApp(QMainWindow):
 
             self.worker = BatchConversionWorker(
                 input_paths=input_paths,
-                library_id=self.library_id_entry.text().strip(),
-                api_key=self.api_key_entry.text().strip(),
+                library_id=library_id,
+                api_key=api_key,
                 library_type=self.library_type_combo.currentText(),
                 verify=self.verify_cb.isChecked(),
-                style_uri=self._get_style_uri(),
+                style_uri=style_uri,
             )
-            self.worker.log_signal.connect(self._log)
-            self.worker.progress_signal.connect(self._on_batch_progress)
+            self.worker.log_signal.connect(self._log_lines)
             self.worker.finished_signal.connect(self._on_batch_finished)
             self.worker.error_signal.connect(self._on_error)
             self.worker.start()
+            self._progress_timer.start()
         else:
             # Single file mode
             file_path = self.file_entry.text().strip()
@@ -1881,46 +2423,74 @@ class CiteMigrateApp(QMainWindow):
                 QMessageBox.warning(self, "Invalid File", "Please select a .docx file.")
                 return
 
-            self.log_text.clear()
+            self._clear_log()
             self.convert_btn.setEnabled(False)
             self.convert_btn.setText("Converting...")
             self.progress.setVisible(True)
-            self.progress.setRange(0, 0)  # indeterminate
-            self.progress_label.setVisible(False)
+            # Coarse stages reported by the worker, instead of a busy
+            # animation repainting for the whole conversion
+            self.progress.setRange(0, 100)
+            self.progress.setValue(0)
+            self.progress_label.setVisible(True)
+            self.progress_label.setText("Starting...")
 
             self.worker = ConversionWorker(
                 input_path=file_path,
-                library_id=self.library_id_entry.text().strip(),
-                api_key=self.api_key_entry.text().strip(),
+                library_id=library_id,
+                api_key=api_key,
                 library_type=self.library_type_combo.currentText(),
                 open_word=self.open_word_cb.isChecked(),
                 verify=self.verify_cb.isChecked(),
-                style_uri=self._get_style_uri(),
+                style_uri=style_uri,
             )
             self.worker.log_signal.connect(self._log)
+            self.worker.stage_signal.connect(self._on_stage)
             self.worker.finished_signal.connect(self._on_finished)
             self.worker.error_signal.connect(self._on_error)
             self.worker.start()
 
     def _cleanup_worker(self):
-        if self.worker is not None:
-            self.worker.quit()
-            if not self.worker.wait(5000):
-                # Thread didn't finish in 5s — force terminate
-                self.worker.terminate()
-                self.worker.wait(2000)
-            self.worker = None
+        """Let go of the current worker without blocking the GUI thread.
+
+        A worker that is still running is asked to stop and kept referenced
+        until its thread has finished; if it hasn't after 5 s it is
+        terminated, as a last resort."""
+        self._progress_timer.stop()
+        worker = self.worker
+        if worker is None:
+            return
+        self.worker = None
+        worker.requestInterruption()
+        worker.quit()
+        if worker.isRunning():
+            self._retired_workers.add(worker)
+            worker.finished.connect(lambda w=worker: self._retired_workers.discard(w))
+            QTimer.singleShot(5000, lambda w=worker: self._terminate_worker(w))
+
+    def _terminate_worker(self, worker):
+        if worker.isRunning():
+            worker.terminate()
+            worker.wait(2000)
+        self._retired_workers.discard(worker)
 
     def _on_finished(self, result):
         self._cleanup_worker()
+        # Nothing to report once the window is closing
+        if self._closing:
+            return
         self.convert_btn.setEnabled(True)
         self.convert_btn.setText("Convert")
         self.progress.setVisible(False)
+        self.progress_label.setVisible(False)
 
         stats = result.get("stats", {})
         verify = result.get("verify", {})
         output = result.get("output_path", "")
 
+        # Start Word first, so it loads while the dialog is being read
+        if result.get("open_word"):
+            self._open_in_word_async(result["input_path"], output)
+
         if verify.get("success"):
             QMessageBox.information(
                 self, "Success",
@@ -1935,7 +2505,7 @@ class CiteMigrateApp(QMainWindow):
                 f"Conversion finished with warnings.\n\n"
                 f"Converted: {stats['converted']}\n"
                 f"Skipped: {stats['skipped']}\n"
-                f"Unmatched: {len(stats.get('unmatched', []))}\n\n"
+                f"Unmatched: {len(stats.get('unmatched', ()))}\n\n"
                 f"Check the log for details."
             )
         else:
@@ -1944,12 +2514,35 @@ class CiteMigrateApp(QMainWindow):
                 "No citations were converted. Check the log for details."
             )
 
+    def _open_in_word_async(self, original_path, converted_path):
+        """Run the Word automation on a daemon thread; it can take seconds
+        and must neither block the GUI nor keep the app from quitting."""
+        def run():
+            try:
+                open_in_word_and_refresh(
+                    original_path, converted_path,
+                    log_callback=lambda msg: self._word_log_signal.emit([msg]))
+            except Exception as e:
+                self._word_log_signal.emit([f"Could not open Word: {e}"])
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _on_stage(self, name, percent):
+        self.progress.setValue(percent)
+        self.progress_label.setText(name)
+
+    def _poll_batch_progress(self):
+        if isinstance(self.worker, BatchConversionWorker):
+            self._on_batch_progress(self.worker.files_done, len(self.worker.input_paths))
+
     def _on_batch_progress(self, current, total):
         self.progress.setValue(current)
         self.progress_label.setText(f"{current} / {total}")
 
     def _on_batch_finished(self, all_stats):
         self._cleanup_worker()
+        if self._closing:
+            return
         self.convert_btn.setEnabled(True)
         self.convert_btn.setText("Convert")
         self.progress.setVisible(False)
@@ -1967,6 +2560,8 @@ class CiteMigrateApp(QMainWindow):
 
     def _on_error(self, error_msg):
         self._cleanup_worker()
+        if self._closing:
+            return
         self.convert_btn.setEnabled(True)
         self.convert_btn.setText("Convert")
         self.progress.setVisible(False)
@@ -1974,8 +2569,17 @@ class CiteMigrateApp(QMainWindow):
         QMessageBox.critical(self, "Error", f"An error occurred:\n{error_msg}")
 
     def closeEvent(self, event):
-        """Ensure worker thread is stopped before closing the window."""
+        """Ensure worker threads are stopped before closing the window.
+
+        Running workers are asked to stop and the window closes once they
+        have, so it never freezes waiting on them."""
+        self._closing = True
         self._cleanup_worker()
+        if self._retired_workers:
+            for worker in self._retired_workers:
+                worker.finished.connect(self.close)
+            event.ignore()
+            return
         super().closeEvent(event)
 
 
@@ -1983,17 +2587,29 @@ class CiteMigrateApp(QMainWindow):
 # ENTRY POINT
 # ══════════════════════════════════════════════
 
+def _find_checkmark():
+    """Path of checkmark.png (white on transparent) for QSS to reference,
+    next to the script or in a bundled resource path (PyInstaller)."""
+    check_candidates = [
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "checkmark.png"),
+        os.path.join(getattr(sys, '_MEIPASS', ''), "checkmark.png"),
+    ]
+    for check_path in check_candidates:
+        if os.path.exists(check_path):
+            return check_path
+    return ""
+
+
 def main():
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
-    app.setStyleSheet(STYLESHEET)
-
-    window = CiteMigrateApp()
 
-    # Inject checkmark image path into checkbox stylesheet (needs runtime path)
-    if window._checkmark_path and os.path.exists(window._checkmark_path):
+    # The full stylesheet is set once, before any widget exists, so the
+    # window is polished a single time
+    check_path = _find_checkmark()
+    if check_path:
         # Use forward slashes for QSS url() even on Windows
-        check_path = window._checkmark_path.replace("\\", "/")
+        check_path = check_path.replace("\\", "/")
         checkbox_checked_qss = (
             f'QCheckBox::indicator:checked {{\n'
             f'    background-color: #007aff;\n'
@@ -2001,12 +2617,13 @@ def main():
             f'    image: url("{check_path}");\n'
             f'}}\n'
         )
-        app.setStyleSheet(app.styleSheet() + checkbox_checked_qss)
     else:
         # Fallback: solid blue without checkmark image
-        app.setStyleSheet(app.styleSheet() +
+        checkbox_checked_qss = (
             'QCheckBox::indicator:checked { background-color: #007aff; border-color: #007aff; }\n')
+    app.setStyleSheet(STYLESHEET + checkbox_checked_qss)
 
+    window = CiteMigrateApp()
     window.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,66 @@
+"""Regression tests for the conversion workers' error paths."""
+
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import citemigrate  # noqa: E402
+
+_DOCUMENT_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:body><w:p><w:sdt><w:sdtPr><w:tag w:val="CitaviPlaceholder#0"/></w:sdtPr>'
+    '<w:sdtContent><w:r><w:t>(Smith 2020)</w:t></w:r></w:sdtContent></w:sdt></w:p>'
+    '</w:body></w:document>'
+)
+
+
+def _unreachable_zotero(*args, **kwargs):
+    raise ConnectionError("Zotero API unreachable")
+
+
+class ConnectionFailureTest(unittest.TestCase):
+    """An unreachable Zotero is reported as such, not as a missing output."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.input_path = os.path.join(tmp.name, "paper.docx")
+        with zipfile.ZipFile(self.input_path, "w") as z:
+            z.writestr("word/document.xml", _DOCUMENT_XML)
+        patcher = mock.patch.object(citemigrate, "ZoteroMatcher", _unreachable_zotero)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        verify = mock.patch.object(citemigrate, "verify_conversion")
+        self.verify_conversion = verify.start()
+        self.addCleanup(verify.stop)
+
+    def test_single_worker_reports_connection_error(self):
+        worker = citemigrate.ConversionWorker(
+            self.input_path, "123", "secretkey", "user", open_word=False, verify=True)
+        errors, finished = [], []
+        worker.error_signal.connect(errors.append)
+        worker.finished_signal.connect(finished.append)
+        worker.run()
+        self.assertEqual(errors, ["Could not connect to Zotero: Zotero API unreachable"])
+        self.assertEqual(finished, [])
+        self.verify_conversion.assert_not_called()
+
+    def test_batch_file_reports_connection_error(self):
+        worker = citemigrate.BatchConversionWorker(
+            [self.input_path], "123", "secretkey", "user", verify=True)
+        blocks = []
+        worker.log_signal.connect(blocks.append)
+        self.assertEqual(worker._process_one(0, self.input_path, None), (None, None))
+        self.assertIn("  ERROR: Could not connect to Zotero: Zotero API unreachable",
+                      blocks[-1])
+        self.verify_conversion.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Regression tests for ZoteroMatcher's library loading."""
+
+import gc
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from urllib.parse import parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx2  # noqa: E402
+
+import citemigrate  # noqa: E402
+
+
+def _library_handler(total):
+    """Mock Zotero API serving ``total`` top-level items, paginated."""
+    def handler(request):
+        query = parse_qs(request.url.query.decode())
+        start = int(query.get("start", ["0"])[0])
+        limit = int(query.get("limit", ["100"])[0])
+        items = [
+            {"key": f"K{i}", "data": {"key": f"K{i}", "itemType": "book",
+                                      "title": f"Title {i}", "creators": []}}
+            for i in range(start, min(start + limit, total))
+        ]
+        return httpx2.Response(200, json=items, headers={
+            "Total-Results": str(total), "Last-Modified-Version": "1"})
+    return handler
+
+
+class PrefetchAfterGCTest(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir.name,
+                                               "LOCALAPPDATA": cache_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _matcher(self, total):
+        real_zotero = citemigrate.zotero.Zotero
+        transport = httpx2.MockTransport(_library_handler(total))
+
+        def make_zotero(*args, client=None, **kwargs):
+            return real_zotero(*args, client=client or httpx2.Client(transport=transport),
+                               **kwargs)
+
+        patcher = mock.patch.object(citemigrate.zotero, "Zotero", make_zotero)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # A library ID per size, so no run is served from another's disk cache
+        return citemigrate.ZoteroMatcher(str(total), "key", "user")
+
+    def test_shared_client_survives_collected_page_threads(self):
+        # A full last page sends the serial tail loop back to self.zot after
+        # the page threads are gone; collecting their pyzotero instances
+        # must not have closed the client it shares with them
+        real_exit = ThreadPoolExecutor.__exit__
+
+        def exit_then_collect(pool, *exc):
+            result = real_exit(pool, *exc)
+            gc.collect()
+            return result
+
+        for total in (400, 450, 1000):
+            with self.subTest(total=total):
+                matcher = self._matcher(total)
+                with mock.patch.object(ThreadPoolExecutor, "__exit__", exit_then_collect):
+                    matcher.prefetch()
+                gc.collect()
+                self.assertEqual(matcher.get_item_count(), total)
+                self.assertFalse(matcher.zot.client.is_closed)
+                matcher.zot.last_modified_version()
+
+
+class CacheTest(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir.name,
+                                               "LOCALAPPDATA": cache_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_truncated_cache_is_a_miss(self):
+        matcher = citemigrate.ZoteroMatcher("123", "key", "user")
+        matcher._store_cached_items(1, [{"key": "K0", "data": {}}])
+        with open(matcher._cache_path, "rb") as f:
+            data = f.read()
+        with open(matcher._cache_path, "wb") as f:
+            f.write(data[:len(data) // 2])
+        with self.assertRaises(EOFError):
+            with gzip.open(matcher._cache_path, "rt", encoding="utf-8") as f:
+                f.read()
+        self.assertIsNone(matcher._load_cached_items(1))
+
+
+if __name__ == "__main__":
+    unittest.main()